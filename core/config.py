@@ -10,15 +10,16 @@ NOUVELLE ARCHITECTURE:
 - Intégration DI Container
 """
 
+import hashlib
 import json
 import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 from pathlib import Path
 
 from dotenv import load_dotenv
 from loguru import logger
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from supabase import create_client, Client
 
 # Nouvelle architecture - Imports ajoutés par migration
@@ -28,6 +29,9 @@ from error_handler import get_error_manager, safe_execute, ErrorSeverity
 # Load environment variables
 load_dotenv()
 
+# Nombre maximum de lignes envoyées par requête Supabase groupée
+SUPABASE_BATCH_SIZE = 100
+
 
 class XAPIPlan(BaseModel):
     """Configuration pour les quotas X API selon le plan"""
@@ -39,14 +43,8 @@ class XAPIPlan(BaseModel):
 
 class XAPIConfig(BaseModel):
     """Configuration X API"""
-    plan: str = Field(default="basic", pattern="^(basic|pro|enterprise)$")
+    plan: Literal["basic", "pro", "enterprise"] = "basic"
     quotas: Dict[str, XAPIPlan]
-    
-    @validator('plan')
-    def validate_plan(cls, v):
-        if v not in ['basic', 'pro', 'enterprise']:
-            raise ValueError('Plan must be basic, pro, or enterprise')
-        return v
 
 
 class PostingConfig(BaseModel):
@@ -144,6 +142,8 @@ class ConfigManager:
         self.supabase: Optional[Client] = None
         self._config: Optional[BotConfig] = None
         self._last_sync: Optional[datetime] = None
+        self._local_digest: Optional[str] = None  # Empreinte du dernier config.json lu
+        self._validated_digest: Optional[str] = None  # Empreinte de la dernière config validée
         
         # Nouvelle architecture - Event Bus et Error Manager
         self.event_bus = get_event_bus()
@@ -193,13 +193,17 @@ class ConfigManager:
     def _load_local_config(self) -> Dict[str, Any]:
         """Load configuration from local JSON file avec error recovery"""
         try:
-            if not self.config_file.exists():
+            # L'ouverture sert de test d'existence (pas d'appel stat séparé)
+            try:
+                with open(self.config_file, 'rb') as f:
+                    raw = f.read()
+            except FileNotFoundError:
                 error_msg = f"Config file {self.config_file} not found"
                 logger.error(f"❌ {error_msg}")
-                raise FileNotFoundError(error_msg)
+                raise FileNotFoundError(error_msg) from None
             
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            self._local_digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            config_data = json.loads(raw)
             
             logger.info(f"✅ Loaded configuration from {self.config_file}")
             
@@ -260,13 +264,14 @@ class ConfigManager:
             # Clear existing config
             self.supabase.table('configs').delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
             
-            # Insert new config
-            for key, value in flat_config.items():
-                self.supabase.table('configs').insert({
-                    'key': key,
-                    'value': value,
-                    'updated_at': datetime.utcnow().isoformat()
-                }).execute()
+            # Insert new config: une requête par lot au lieu d'une par clé
+            updated_at = datetime.utcnow().isoformat()
+            rows = [
+                {'key': key, 'value': value, 'updated_at': updated_at}
+                for key, value in flat_config.items()
+            ]
+            for start in range(0, len(rows), SUPABASE_BATCH_SIZE):
+                self.supabase.table('configs').insert(rows[start:start + SUPABASE_BATCH_SIZE]).execute()
             
             logger.info("Configuration saved to Supabase")
             self._last_sync = datetime.utcnow()
@@ -316,9 +321,15 @@ class ConfigManager:
                         self._save_to_supabase(local_config)
             else:
                 config_data = local_config
+                
+                # Fichier local inchangé depuis la dernière validation: rien à revalider
+                if self._config is not None and self._local_digest == self._validated_digest:
+                    logger.debug("Configuration file unchanged, skipping validation")
+                    return
             
             # Validate and create config object
-            self._config = BotConfig(**config_data)
+            self._config = BotConfig.model_validate(config_data)
+            self._validated_digest = None if self.supabase else self._local_digest
             logger.info("✅ Configuration reloaded successfully")
             
             # Publier événement de reload complet
@@ -361,13 +372,13 @@ class ConfigManager:
         """
         try:
             # Get current config as dict
-            current_config = self._config.dict() if self._config else self._load_local_config()
+            current_config = self._config.model_dump() if self._config else self._load_local_config()
             
             # Apply updates (deep merge)
             updated_config = self._deep_merge(current_config, updates)
             
             # Validate new config
-            new_config = BotConfig(**updated_config)
+            new_config = BotConfig.model_validate(updated_config)
             
             # Save to local file
             with open(self.config_file, 'w', encoding='utf-8') as f:
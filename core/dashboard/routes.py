@@ -6,8 +6,9 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
+from operator import itemgetter
 
 try:
     from fastapi import FastAPI, Request
@@ -16,6 +17,7 @@ except ImportError:
     Request = None
 
 from loguru import logger
+from prompt_manager import read_json_file
 from .config import DashboardConfig
 
 
@@ -350,20 +352,24 @@ def setup_routes(app: FastAPI, bot_managers: dict, start_time: datetime, config:
             
             if viral_tweets:
                 # Enrichir avec des métadonnées utiles
+                # Horodatage commun à toute la collecte
+                collection_time = datetime.utcnow().isoformat()
                 enriched_tweets = []
                 for tweet in viral_tweets:
+                    text = tweet.get("text", "")
+                    metrics = tweet.get("metrics", {})
                     enriched_tweet = {
-                        "text": tweet.get("text", ""),
-                        "metrics": tweet.get("metrics", {}),
+                        "text": text,
+                        "metrics": metrics,
                         "virality_score": tweet.get("virality_score", 0),
                         "topics": tweet.get("topics", []),
                         "style": tweet.get("style", {}),
-                        "length": len(tweet.get("text", "")),
-                        "has_hashtags": "#" in tweet.get("text", ""),
-                        "has_mentions": "@" in tweet.get("text", ""),
-                        "has_emoji": any(ord(char) > 127 for char in tweet.get("text", "")),
-                        "estimated_engagement": tweet.get("metrics", {}).get("engagement_rate", 0),
-                        "collection_time": datetime.utcnow().isoformat()
+                        "length": len(text),
+                        "has_hashtags": "#" in text,
+                        "has_mentions": "@" in text,
+                        "has_emoji": any(ord(char) > 127 for char in text),
+                        "estimated_engagement": metrics.get("engagement_rate", 0),
+                        "collection_time": collection_time
                     }
                     enriched_tweets.append(enriched_tweet)
                 
@@ -372,12 +378,12 @@ def setup_routes(app: FastAPI, bot_managers: dict, start_time: datetime, config:
                     "data": {
                         "tweets": enriched_tweets,
                         "total_found": len(enriched_tweets),
-                        "collection_time": datetime.utcnow().isoformat(),
+                        "collection_time": collection_time,
                         "analysis": {
                             "avg_length": sum(t["length"] for t in enriched_tweets) / len(enriched_tweets) if enriched_tweets else 0,
-                            "with_hashtags": sum(1 for t in enriched_tweets if t["has_hashtags"]),
-                            "with_mentions": sum(1 for t in enriched_tweets if t["has_mentions"]),
-                            "with_emoji": sum(1 for t in enriched_tweets if t["has_emoji"]),
+                            "with_hashtags": sum(map(itemgetter("has_hashtags"), enriched_tweets)),
+                            "with_mentions": sum(map(itemgetter("has_mentions"), enriched_tweets)),
+                            "with_emoji": sum(map(itemgetter("has_emoji"), enriched_tweets)),
                             "avg_virality": sum(t["virality_score"] for t in enriched_tweets) / len(enriched_tweets) if enriched_tweets else 0
                         }
                     }
@@ -397,6 +403,19 @@ def setup_routes(app: FastAPI, bot_managers: dict, start_time: datetime, config:
             return {"success": False, "error": str(e)}
 
 
+def _read_first_json(paths: List[Path]) -> Optional[dict]:
+    """
+    Lit le premier fichier JSON existant parmi les chemins candidats
+    
+    Le dict retourné est partagé (cache de read_json_file), ne pas le modifier en place.
+    """
+    for path in paths:
+        data = read_json_file(path)
+        if data is not None:
+            return data
+    return None
+
+
 def get_config_fallback() -> dict:
     """Lecture directe du fichier de configuration"""
     try:
@@ -407,10 +426,9 @@ def get_config_fallback() -> dict:
             Path("config/config.json"),        # Depuis racine
         ]
         
-        for config_path in config_paths:
-            if config_path.exists():
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+        config_data = _read_first_json(config_paths)
+        if config_data is not None:
+            return config_data
         
         # Configuration par défaut si aucun fichier trouvé
         return {
@@ -452,10 +470,9 @@ def get_prompts_fallback() -> dict:
             Path("config/prompts.json"),        # Depuis racine
         ]
         
-        for prompts_path in prompts_paths:
-            if prompts_path.exists():
-                with open(prompts_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+        prompts_data = _read_first_json(prompts_paths)
+        if prompts_data is not None:
+            return prompts_data
         
         # Configuration par défaut si aucun fichier trouvé
         return {
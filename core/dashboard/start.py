@@ -18,6 +18,9 @@ root_dir = core_dir.parent           # racine
 sys.path.insert(0, str(root_dir))
 sys.path.insert(0, str(core_dir))
 
+# Séparateur d'affichage (construit une seule fois)
+SEPARATOR = "=" * 40
+
 try:
     from core.dashboard import start_dashboard
     from core.dashboard.config import DashboardConfig
@@ -50,11 +53,11 @@ def main():
     args = parser.parse_args()
     
     print("🤖 Dashboard Twitter Bot v2.0")
-    print("=" * 40)
+    print(SEPARATOR)
     print(f"🌐 Host: {args.host}")
     print(f"🔌 Port: {args.port}")
     print(f"🐛 Debug: {args.debug}")
-    print("=" * 40)
+    print(SEPARATOR)
     
     try:
         # Configuration
@@ -16,11 +16,10 @@ NOUVELLE ARCHITECTURE:
 
 import os
 import random
+import re
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
-from io import BytesIO
 
-import openai
 import requests
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -30,6 +29,37 @@ from events import get_event_bus, EventTypes, EventPriority
 from error_handler import get_error_manager, safe_execute, ErrorSeverity
 
 
+def _keywords_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile une liste de mots-clés en une alternation (recherche de sous-chaîne)"""
+    return re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords))
+
+
+# Sujets détectés par mots-clés (patterns compilés une seule fois)
+_TOPIC_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("tech", _keywords_pattern(["AI", "IA", "intelligence", "technologie", "innovation", "startup", "tech"])),
+    ("trends", _keywords_pattern(["viral", "trending", "populaire", "buzz", "phénomène"])),
+    ("business", _keywords_pattern(["entreprise", "business", "succès", "croissance", "stratégie"])),
+)
+
+# Termes techniques pour l'analyse de complexité
+_TECHNICAL_TERMS_PATTERN = _keywords_pattern([
+    'blockchain', 'defi', 'nft', 'smart contract', 'liquidity', 'yield',
+    'staking', 'dao', 'governance', 'tokenomics', 'consensus', 'validator'
+])
+
+# Vocabulaire pour l'analyse de sentiment (tuples immuables, construits une seule fois)
+_POSITIVE_WORDS = (
+    'great', 'amazing', 'awesome', 'fantastic', 'excellent', 'love', 'best',
+    'incredible', 'wonderful', 'brilliant', 'perfect', 'outstanding',
+    'bullish', 'moon', 'pump', 'gains', 'winning', 'success', 'boom'
+)
+_NEGATIVE_WORDS = (
+    'terrible', 'awful', 'horrible', 'worst', 'hate', 'bad', 'fail',
+    'disaster', 'crash', 'dump', 'bear', 'rekt', 'loss', 'scam',
+    'rug', 'dead', 'broke', 'panic', 'fear'
+)
+
+
 class ContentGenerator:
     """
     Générateur de contenu intelligent avec nouvelle architecture
@@ -343,20 +373,8 @@ class ContentGenerator:
         """Extrait les sujets principaux d'un tweet"""
         # Simple extraction basée sur mots-clés
         # En production, on pourrait utiliser NLP plus sophistiqué
-        
-        tech_keywords = ["AI", "IA", "intelligence", "technologie", "innovation", "startup", "tech"]
-        trend_keywords = ["viral", "trending", "populaire", "buzz", "phénomène"]
-        business_keywords = ["entreprise", "business", "succès", "croissance", "stratégie"]
-        
         text_lower = text.lower()
-        topics = []
-        
-        if any(keyword.lower() in text_lower for keyword in tech_keywords):
-            topics.append("tech")
-        if any(keyword.lower() in text_lower for keyword in trend_keywords):
-            topics.append("trends")
-        if any(keyword.lower() in text_lower for keyword in business_keywords):
-            topics.append("business")
+        topics = [topic for topic, pattern in _TOPIC_PATTERNS if pattern.search(text_lower)]
         
         return topics if topics else ["general"]
     
@@ -375,23 +393,9 @@ class ContentGenerator:
         """Analyse le sentiment d'un tweet (simple)"""
         text_lower = text.lower()
         
-        # Mots positifs
-        positive_words = [
-            'great', 'amazing', 'awesome', 'fantastic', 'excellent', 'love', 'best',
-            'incredible', 'wonderful', 'brilliant', 'perfect', 'outstanding',
-            'bullish', 'moon', 'pump', 'gains', 'winning', 'success', 'boom'
-        ]
-        
-        # Mots négatifs
-        negative_words = [
-            'terrible', 'awful', 'horrible', 'worst', 'hate', 'bad', 'fail',
-            'disaster', 'crash', 'dump', 'bear', 'rekt', 'loss', 'scam',
-            'rug', 'dead', 'broke', 'panic', 'fear'
-        ]
-        
         # Compter les mots
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        positive_count = sum(1 for word in _POSITIVE_WORDS if word in text_lower)
+        negative_count = sum(1 for word in _NEGATIVE_WORDS if word in text_lower)
         
         if positive_count > negative_count:
             return 'positive'
@@ -406,10 +410,7 @@ class ContentGenerator:
         
         # Facteurs de complexité
         avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
-        has_technical_terms = any(term in text.lower() for term in [
-            'blockchain', 'defi', 'nft', 'smart contract', 'liquidity', 'yield',
-            'staking', 'dao', 'governance', 'tokenomics', 'consensus', 'validator'
-        ])
+        has_technical_terms = _TECHNICAL_TERMS_PATTERN.search(text.lower()) is not None
         has_numbers = any(char.isdigit() for char in text)
         sentence_count = text.count('.') + text.count('!') + text.count('?') + 1
         
@@ -629,9 +630,7 @@ class ContentGenerator:
         if not content:
             return False
         
-        # Obtenir les limites spécifiques au type
-        type_config = self.get_tweet_type_config(tweet_type)
-        max_length = min(280, type_config.get('max_tokens', 280) * 4)  # Approximation caractères/tokens
+        content_lower = content.lower()
         
         # Vérifier la longueur
         if len(content) > 280:  # Limite Twitter absolue
@@ -658,13 +657,11 @@ class ContentGenerator:
         elif tweet_type == "personal_story":
             # Les histoires personnelles devraient avoir des marqueurs émotionnels
             emotional_words = ["i", "me", "my", "felt", "learned", "remember", "experience"]
-            content_lower = content.lower()
             if not any(word in content_lower for word in emotional_words):
                 logger.warning("Personal story lacks personal touch")
                 # Ne pas rejeter, mais noter
         
         # Vérifier qu'il ne répète pas un sujet récent
-        content_lower = content.lower()
         for recent_topic in self._last_generated_topics[-10:]:
             if recent_topic.lower() in content_lower:
                 logger.warning(f"Content repeats recent topic: {recent_topic}")
@@ -8,7 +8,8 @@ import os
 import requests
 import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, FrozenSet
 from openai import OpenAI
 from loguru import logger
 
@@ -122,6 +123,7 @@ class LMStudioProvider(BaseLLMProvider):
         self.active_url = None
         self._configured_model = None  # Auto-détecté
         self._available_models = []
+        self._available_model_set: FrozenSet[str] = frozenset()  # Tests d'appartenance O(1)
         
     def initialize(self) -> bool:
         """Initialise le client LM Studio avec auto-détection du modèle"""
@@ -207,6 +209,7 @@ class LMStudioProvider(BaseLLMProvider):
             # Stocker les infos des modèles pour le manager
             self._configured_model = selected_model
             self._available_models = available_models
+            self._available_model_set = frozenset(available_models)
             
             logger.info(f"✅ LM Studio connected at {url}")
             logger.info(f"🤖 Model: {selected_model}")
@@ -235,7 +238,7 @@ class LMStudioProvider(BaseLLMProvider):
             model_to_use = kwargs.get('model') or self._configured_model
             
             # Vérifier que le modèle est disponible
-            if self._available_models and model_to_use not in self._available_models:
+            if self._available_model_set and model_to_use not in self._available_model_set:
                 logger.warning(f"Model {model_to_use} not available, using {self._configured_model}")
                 model_to_use = self._configured_model
             
@@ -293,19 +296,23 @@ class LLMProviderManager:
         """Initialise tous les providers disponibles"""
         success = False
         
-        # Initialiser OpenAI
-        openai_provider = OpenAIProvider({})
-        if openai_provider.initialize():
-            self.providers["openai"] = openai_provider
-            success = True
-            logger.info("✅ OpenAI provider ready")
+        # Initialiser OpenAI et LM Studio en parallèle (tests réseau indépendants)
+        candidates = {
+            "openai": ("OpenAI", OpenAIProvider({})),
+            "lmstudio": ("LM Studio", LMStudioProvider({}))
+        }
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            futures = {
+                name: executor.submit(provider.initialize)
+                for name, (_, provider) in candidates.items()
+            }
         
-        # Initialiser LM Studio
-        lm_provider = LMStudioProvider({})
-        if lm_provider.initialize():
-            self.providers["lmstudio"] = lm_provider
-            success = True
-            logger.info("✅ LM Studio provider ready")
+        # Enregistrer dans l'ordre d'origine (utilisé pour la priorité auto)
+        for name, (label, provider) in candidates.items():
+            if futures[name].result():
+                self.providers[name] = provider
+                success = True
+                logger.info(f"✅ {label} provider ready")
         
         # Déterminer la priorité basée sur la config
         preferred_provider = os.getenv("LLM_PROVIDER", "auto").lower()
@@ -256,13 +256,13 @@ class TwitterBot:
         logger.info("🔄 Entering main loop with event-driven architecture...")
         
         # Health check périodique via événements
-        last_health_check = time.time()
+        last_health_check = time.monotonic()
         health_check_interval = 300  # 5 minutes
         
         try:
             while not self._shutdown_requested:
                 # Health check périodique
-                current_time = time.time()
+                current_time = time.monotonic()
                 if current_time - last_health_check > health_check_interval:
                     self.event_bus.publish(
                         EventTypes.HEALTH_CHECK,
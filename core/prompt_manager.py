@@ -13,14 +13,52 @@ NOUVELLE ARCHITECTURE:
 
 import json
 import os
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Union
 from loguru import logger
 
+# Parser JSON rapide optionnel (fallback stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Nouvelle architecture - Imports ajoutés par migration
 from events import get_event_bus, EventTypes, EventPriority
 from error_handler import get_error_manager, safe_execute, ErrorSeverity
 
 
+@lru_cache(maxsize=16)
+def _parse_json_file(path: str, mtime_ns: int, size: int, inode: int) -> Dict[str, Any]:
+    """Parse un fichier JSON (mis en cache par chemin, date de modification, taille et inode)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_json_file(path: Union[str, os.PathLike]) -> Optional[Dict[str, Any]]:
+    """
+    Lit un fichier JSON en réutilisant le résultat tant qu'il n'a pas changé
+    
+    Un seul os.stat sert à la fois de test d'existence et de clé de cache
+    (chemin absolu, pour ne pas dépendre du répertoire courant). La taille et
+    l'inode complètent la date de modification, dont la résolution peut
+    confondre deux écritures rapprochées ou un remplacement atomique.
+    Le dict retourné est partagé: ne pas le modifier en place.
+    
+    Returns:
+        Dict parsé, None si le fichier n'existe pas
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _parse_json_file(os.path.abspath(path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 class PromptManager:
     """
     Gestionnaire centralisé des prompts et templates avec nouvelle architecture
@@ -94,13 +132,13 @@ class PromptManager:
     def _load_prompts(self) -> None:
         """Charge les prompts depuis le fichier JSON avec error recovery"""
         try:
-            if not os.path.exists(self.prompts_file):
+            prompts_data = read_json_file(self.prompts_file)
+            if prompts_data is None:
                 logger.warning(f"⚠️ Prompts file not found: {self.prompts_file}")
                 self._create_default_prompts()
                 return
             
-            with open(self.prompts_file, 'r', encoding='utf-8') as f:
-                self.prompts_data = json.load(f)
+            self.prompts_data = prompts_data
                 
             logger.info(f"✅ Prompts loaded successfully from {self.prompts_file}")
             
@@ -123,13 +161,13 @@ class PromptManager:
     def _load_config(self) -> None:
         """Charge la configuration depuis config.json"""
         try:
-            if not os.path.exists(self.config_file):
+            config_data = read_json_file(self.config_file)
+            if config_data is None:
                 logger.warning(f"Config file not found: {self.config_file}")
                 self.config_data = {}
                 return
             
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config_data = json.load(f)
+            self.config_data = config_data
                 
             logger.info(f"Config loaded successfully from {self.config_file}")
             
@@ -320,10 +358,11 @@ class PromptManager:
             bool: True si succès
         """
         try:
-            if category not in self.prompts_data:
-                self.prompts_data[category] = {}
-            
-            self.prompts_data[category][prompt_type] = content
+            # Copie plutôt que modification en place (dict partagé par le cache)
+            self.prompts_data = {
+                **self.prompts_data,
+                category: {**self.prompts_data.get(category, {}), prompt_type: content}
+            }
             
             # Sauvegarder dans le fichier
             with open(self.prompts_file, 'w', encoding='utf-8') as f:
@@ -348,8 +387,9 @@ class PromptManager:
             str: Prompt pour DALL-E
         """
         try:
-            base_prompt = self.prompts_data["system_prompts"]["image_generation"]["base_prompt"]
-            style_suffix = self.prompts_data["system_prompts"]["image_generation"]["style_suffix"]
+            image_generation = self.prompts_data["system_prompts"]["image_generation"]
+            base_prompt = image_generation["base_prompt"]
+            style_suffix = image_generation["style_suffix"]
             
             # Déterminer le thème
             themes = self.prompts_data["templates"]["image_themes"]
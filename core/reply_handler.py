@@ -136,10 +136,17 @@ class ReplyHandler:
             else:
                 logger.info(f"🔍 Regular check: Scanning {len(our_tweets)} tweets from last 24 hours...")
             
+            # Résolus une fois hors des boucles
+            get_tweet_replies = self.twitter_manager.get_tweet_replies
+            get_existing_reply_ids = self.storage_manager.get_existing_reply_ids
+            processed_replies = self._processed_replies
+            auto_like_enabled = config.engagement.auto_like_replies
+            auto_reply_enabled = config.engagement.auto_reply_enabled
+            
             for tweet in our_tweets:
                 try:
                     # Chercher les réponses pour ce tweet
-                    replies = self.twitter_manager.get_tweet_replies(
+                    replies = get_tweet_replies(
                         tweet.tweet_id, 
                         max_results=10
                     )
@@ -149,41 +156,49 @@ class ReplyHandler:
                     
                     # 🚀 OPTIMISATION: Vérifier en lot quelles réponses existent déjà
                     reply_ids = [reply.reply_id for reply in replies]
-                    existing_reply_ids = set(self.storage_manager.get_existing_reply_ids(reply_ids))
+                    existing_reply_ids = frozenset(get_existing_reply_ids(reply_ids))
                     
+                    new_replies = []
+                    new_reply_ids = set()
                     for reply in replies:
                         # Éviter les doublons (cache mémoire)
-                        if reply.reply_id in self._processed_replies:
+                        if reply.reply_id in processed_replies or reply.reply_id in new_reply_ids:
                             continue
                         
                         # 🚀 NOUVEAU: Éviter les doublons (base de données)
                         if reply.reply_id in existing_reply_ids:
                             # Ajouter au cache pour éviter les vérifications futures
-                            self._processed_replies.add(reply.reply_id)
+                            processed_replies.add(reply.reply_id)
                             logger.debug(f"Reply {reply.reply_id} already exists in database, skipping")
                             continue
-                            
-                        # Marquer comme traité
-                        self._processed_replies.add(reply.reply_id)
-                        stats['new_replies'] += 1
                         
-                        # Sauvegarder la réponse (maintenant avec gestion des duplicatas intégrée)
-                        saved_id = self.storage_manager.save_reply(reply)
+                        new_reply_ids.add(reply.reply_id)
+                        new_replies.append(reply)
+                    
+                    if new_replies:
+                        # Sauvegarder les réponses en un seul lot (doublons ignorés)
+                        saved_ids = frozenset(self.storage_manager.save_replies_batch(new_replies))
                         
-                        if saved_id:
+                        # Marquer comme traité seulement après une sauvegarde réussie
+                        processed_replies.update(new_reply_ids)
+                        stats['new_replies'] += len(new_replies)
+                        
+                        for reply in new_replies:
+                            if reply.reply_id not in saved_ids:
+                                logger.debug(f"Reply {reply.reply_id} was not saved (likely duplicate)")
+                                continue
+                            
                             # Auto-like si activé
-                            if config.engagement.auto_like_replies:
-                                if self._auto_like_reply(reply.reply_id):
+                            if auto_like_enabled:
+                                if self._auto_like_reply(reply.reply_id, reply.author_id):
                                     stats['likes_sent'] += 1
                                     # Marquer comme liké en base
                                     self.storage_manager.mark_reply_liked(reply.reply_id)
                             
                             # Auto-réponse si activée
-                            if config.engagement.auto_reply_enabled:
+                            if auto_reply_enabled:
                                 if self._auto_reply_to_comment(reply):
                                     stats['replies_sent'] += 1
-                        else:
-                            logger.debug(f"Reply {reply.reply_id} was not saved (likely duplicate)")
                     
                     # Petit délai pour éviter rate limiting
                     time.sleep(1)
@@ -213,32 +228,20 @@ class ReplyHandler:
             logger.error(f"Error in reply checking: {e}")
             return {'error': str(e)}
     
-    def _auto_like_reply(self, reply_id: str) -> bool:
+    def _auto_like_reply(self, reply_id: str, author_id: Optional[str] = None) -> bool:
         """
         Like automatique d'une réponse
         
         Args:
             reply_id: ID de la réponse à liker
+            author_id: Auteur de la réponse si déjà connu (évite un appel API)
             
         Returns:
             bool: True si succès
         """
         try:
-            # 🚨 ADDITIONAL CHECK: Don't like our own tweets (double protection)
-            if self.twitter_manager.bot_user_id:
-                try:
-                    # Get tweet to check author
-                    tweet_response = self.twitter_manager.client.get_tweet(reply_id, tweet_fields=['author_id'])
-                    tweet_data = tweet_response.data if hasattr(tweet_response, 'data') else tweet_response.get('data')
-                    
-                    if tweet_data and tweet_data.get('author_id') == self.twitter_manager.bot_user_id:
-                        logger.debug(f"Skipping auto-like for bot's own tweet {reply_id}")
-                        return False
-                        
-                except Exception as e:
-                    logger.debug(f"Could not verify tweet author for {reply_id}: {e}")
-            
-            success = self.twitter_manager.like_tweet(reply_id)
+            # like_tweet ignore déjà les tweets du bot
+            success = self.twitter_manager.like_tweet(reply_id, author_id=author_id)
             if success:
                 logger.info(f"Auto-liked reply: {reply_id}")
                 return True
@@ -335,10 +338,16 @@ class ReplyHandler:
             str: Réponse générée ou None
         """
         try:
-            # Obtenir les settings depuis la config centralisée
-            model = self.prompt_manager.get_setting("auto_reply", "model")
-            max_tokens = self.prompt_manager.get_setting("auto_reply", "max_tokens")
-            temperature = self.prompt_manager.get_setting("auto_reply", "temperature")
+            # Aucun provider joignable: inutile de résoudre le username ni d'appeler le LLM
+            if not self.llm_manager or not self.llm_manager.has_available_providers():
+                logger.warning("No LLM provider available - skipping reply generation")
+                return None
+            
+            # Obtenir les settings depuis la config centralisée (une seule lecture)
+            auto_reply_settings = self.prompt_manager.get_setting("auto_reply") or {}
+            model = auto_reply_settings.get("model")
+            max_tokens = auto_reply_settings.get("max_tokens")
+            temperature = auto_reply_settings.get("temperature")
             
             # 🔧 Récupérer le username de l'auteur du commentaire
             username = self._get_username_from_author_id(reply.author_id)
@@ -466,32 +475,36 @@ class ReplyHandler:
             # Vider temporairement le cache pour retraiter
             self._processed_replies.clear()
             
+            # Résolus une fois hors des boucles
+            get_tweet_replies = self.twitter_manager.get_tweet_replies
+            auto_like_enabled = config.engagement.auto_like_replies
+            auto_reply_enabled = config.engagement.auto_reply_enabled
+            
             for tweet in our_tweets:
                 try:
                     # Chercher les réponses pour ce tweet
-                    replies = self.twitter_manager.get_tweet_replies(
+                    replies = get_tweet_replies(
                         tweet.tweet_id, 
                         max_results=10
                     )
                     
-                    for reply in replies:
-                        # Vérifier si déjà dans le cache original
-                        if reply.reply_id in original_cache:
-                            continue
-                            
-                        stats['new_replies'] += 1
-                        
-                        # Sauvegarder la réponse
-                        self.storage_manager.save_reply(reply)
-                        
+                    # Ignorer les réponses déjà dans le cache original
+                    new_replies = [reply for reply in replies if reply.reply_id not in original_cache]
+                    stats['new_replies'] += len(new_replies)
+                    
+                    # Sauvegarder les réponses en un seul lot (doublons ignorés)
+                    if new_replies:
+                        self.storage_manager.save_replies_batch(new_replies)
+                    
+                    for reply in new_replies:
                         # Auto-like si activé
-                        if config.engagement.auto_like_replies:
-                            if self._auto_like_reply(reply.reply_id):
+                        if auto_like_enabled:
+                            if self._auto_like_reply(reply.reply_id, reply.author_id):
                                 stats['likes_sent'] += 1
                                 self.storage_manager.mark_reply_liked(reply.reply_id)
                         
                         # Auto-réponse si activée
-                        if config.engagement.auto_reply_enabled:
+                        if auto_reply_enabled:
                             if self._auto_reply_to_comment(reply):
                                 stats['replies_sent'] += 1
                     
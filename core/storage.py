@@ -16,6 +16,7 @@ NOUVELLE ARCHITECTURE:
 
 import os
 import uuid
+from operator import itemgetter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass
@@ -29,6 +30,17 @@ from events import get_event_bus, EventTypes, EventPriority
 from error_handler import get_error_manager, safe_execute, ErrorSeverity
 
 
+PREVIEW_LENGTH = 100
+
+# Taille des lots pour les filtres IN (limite pratique de longueur d'URL PostgREST)
+IN_FILTER_CHUNK_SIZE = 100
+
+
+def _preview(content: str) -> str:
+    """Tronque un contenu à PREVIEW_LENGTH caractères"""
+    return content[:PREVIEW_LENGTH] + '...' if len(content) > PREVIEW_LENGTH else content
+
+
 @dataclass
 class Tweet:
     """Modèle pour un tweet"""
@@ -44,6 +56,18 @@ class Tweet:
             self.engagement = {}
         if self.posted_at is None:
             self.posted_at = datetime.utcnow()
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'Tweet':
+        """Construit un Tweet depuis une ligne Supabase"""
+        return cls(
+            id=row['id'],
+            tweet_id=row['tweet_id'],
+            content=row['content'],
+            image_url=row.get('image_url'),
+            posted_at=datetime.fromisoformat(row['posted_at'].replace('Z', '+00:00')),
+            engagement=row.get('engagement', {})
+        )
 
 
 @dataclass
@@ -60,6 +84,19 @@ class Reply:
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.utcnow()
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'Reply':
+        """Construit une Reply depuis une ligne Supabase"""
+        return cls(
+            id=row['id'],
+            reply_id=row['reply_id'],
+            original_tweet_id=row['original_tweet_id'],
+            author_id=row['author_id'],
+            content=row['content'],
+            created_at=datetime.fromisoformat(row['created_at'].replace('Z', '+00:00')),
+            liked=row.get('liked', False)
+        )
 
 
 @dataclass
@@ -166,6 +203,13 @@ class StorageManager:
     def _init_supabase(self) -> None:
         """Initialize Supabase client avec error recovery"""
         try:
+            # Réutiliser le client déjà ouvert par le ConfigManager (mêmes credentials)
+            shared_client = getattr(self.config_manager, 'supabase', None)
+            if shared_client is not None:
+                self.supabase = shared_client
+                logger.info("✅ Supabase storage client initialized (shared with config)")
+                return
+            
             supabase_url = os.getenv("SUPABASE_URL")
             supabase_key = os.getenv("SUPABASE_KEY")
             
@@ -194,6 +238,16 @@ class StorageManager:
                 except Exception as e:
                     logger.warning(f"Table '{table}' might not exist: {e}")
             
+            # Les vérifications de doublons (IN sur reply_id) doivent rester indexées
+            try:
+                index_response = self.supabase.rpc('has_reply_id_index').execute()
+                if index_response.data is False:
+                    logger.error("❌ Missing index on replies(reply_id): duplicate checks will scan the whole table")
+                else:
+                    logger.debug("Index on replies(reply_id) present")
+            except Exception as e:
+                logger.warning(f"Could not verify replies(reply_id) index (run scripts/sql/init_supabase.sql): {e}")
+            
             logger.info("Database tables check completed")
             
         except Exception as e:
@@ -322,7 +376,7 @@ class StorageManager:
                     data={
                         'tweet_id': tweet.tweet_id,
                         'storage_id': tweet_id,
-                        'content': tweet.content[:100] + '...' if len(tweet.content) > 100 else tweet.content
+                        'content': _preview(tweet.content)
                     },
                     source='StorageManager'
                 )
@@ -448,8 +502,8 @@ class StorageManager:
                     ).execute()
                     if existing_response.data:
                         return existing_response.data[0]['id']
-                except:
-                    pass
+                except Exception as lookup_error:
+                    logger.debug(f"Could not fetch existing reply {reply.reply_id}: {lookup_error}")
                 return None
             else:
                 logger.error(f"Failed to save reply: {e}")
@@ -457,6 +511,55 @@ class StorageManager:
         
         return None
     
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    def save_replies_batch(self, replies: List[Reply]) -> List[str]:
+        """
+        Save several replies in a single request, skipping duplicates
+        
+        Issues one INSERT ... ON CONFLICT (reply_id) DO NOTHING for the whole
+        batch instead of an existence check plus an insert per reply.
+        
+        Args:
+            replies: Reply objects to save
+            
+        Returns:
+            List[str]: reply_id of the replies actually inserted (duplicates excluded)
+        """
+        if not self.supabase:
+            logger.warning("Supabase not available, cannot save replies")
+            return []
+        
+        # Dédupliquer dans le lot en conservant l'ordre
+        unique_replies = {reply.reply_id: reply for reply in replies}
+        if not unique_replies:
+            return []
+        
+        now = datetime.utcnow().isoformat()
+        rows = [
+            {
+                'reply_id': reply.reply_id,
+                'original_tweet_id': reply.original_tweet_id,
+                'author_id': reply.author_id,
+                'content': reply.content,
+                'created_at': reply.created_at.isoformat() if reply.created_at else now,
+                'liked': reply.liked
+            }
+            for reply in unique_replies.values()
+        ]
+        
+        try:
+            response = self.supabase.table('replies').upsert(
+                rows, on_conflict='reply_id', ignore_duplicates=True
+            ).execute()
+            
+            inserted_ids = [item['reply_id'] for item in response.data or ()]
+            logger.debug(f"Replies batch saved: {len(inserted_ids)}/{len(rows)} inserted")
+            return inserted_ids
+            
+        except Exception as e:
+            logger.error(f"Failed to save replies batch: {e}")
+            raise
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def mark_reply_liked(self, reply_id: str) -> bool:
         """
@@ -501,19 +604,8 @@ class StorageManager:
                 'posted_at', cutoff_time.isoformat()
             ).order('posted_at', desc=True).execute()
             
-            tweets = []
-            if response.data:
-                for tweet_data in response.data:
-                    tweet = Tweet(
-                        id=tweet_data['id'],
-                        tweet_id=tweet_data['tweet_id'],
-                        content=tweet_data['content'],
-                        image_url=tweet_data.get('image_url'),
-                        posted_at=datetime.fromisoformat(tweet_data['posted_at'].replace('Z', '+00:00')),
-                        engagement=tweet_data.get('engagement', {})
-                    )
-                    tweets.append(tweet)
-                    
+            tweets = [Tweet.from_row(tweet_data) for tweet_data in response.data or ()]
+            if tweets:
                 logger.info(f"Retrieved {len(tweets)} recent tweets from last {hours} hours")
             
             return tweets
@@ -542,19 +634,8 @@ class StorageManager:
                 'posted_at', desc=True
             ).limit(limit).execute()
             
-            tweets = []
-            if response.data:
-                for tweet_data in response.data:
-                    tweet = Tweet(
-                        id=tweet_data['id'],
-                        tweet_id=tweet_data['tweet_id'],
-                        content=tweet_data['content'],
-                        image_url=tweet_data.get('image_url'),
-                        posted_at=datetime.fromisoformat(tweet_data['posted_at'].replace('Z', '+00:00')),
-                        engagement=tweet_data.get('engagement', {})
-                    )
-                    tweets.append(tweet)
-                    
+            tweets = [Tweet.from_row(tweet_data) for tweet_data in response.data or ()]
+            if tweets:
                 logger.debug(f"Retrieved {len(tweets)} recent tweets")
             
             return tweets
@@ -584,20 +665,8 @@ class StorageManager:
                 'created_at', cutoff_time.isoformat()
             ).order('created_at', desc=True).execute()
             
-            replies = []
-            if response.data:
-                for reply_data in response.data:
-                    reply = Reply(
-                        id=reply_data['id'],
-                        reply_id=reply_data['reply_id'],
-                        original_tweet_id=reply_data['original_tweet_id'],
-                        author_id=reply_data['author_id'],
-                        content=reply_data['content'],
-                        created_at=datetime.fromisoformat(reply_data['created_at'].replace('Z', '+00:00')),
-                        liked=reply_data.get('liked', False)
-                    )
-                    replies.append(reply)
-                    
+            replies = [Reply.from_row(reply_data) for reply_data in response.data or ()]
+            if replies:
                 logger.debug(f"Retrieved {len(replies)} recent replies from last {hours} hours")
             
             return replies
@@ -644,14 +713,15 @@ class StorageManager:
             return []
             
         try:
-            response = self.supabase.table('replies').select('reply_id').in_(
-                'reply_id', reply_ids
-            ).execute()
+            # Une requête IN par lot (un seul aller-retour pour les listes courtes)
+            existing_ids = []
+            for start in range(0, len(reply_ids), IN_FILTER_CHUNK_SIZE):
+                response = self.supabase.table('replies').select('reply_id').in_(
+                    'reply_id', reply_ids[start:start + IN_FILTER_CHUNK_SIZE]
+                ).execute()
+                existing_ids.extend(item['reply_id'] for item in response.data or ())
             
-            if response.data:
-                return [item['reply_id'] for item in response.data]
-            
-            return []
+            return existing_ids
             
         except Exception as e:
             logger.error(f"Failed to get existing reply IDs: {e}")
@@ -696,6 +766,50 @@ class StorageManager:
             logger.error(f"Failed to save stats: {e}")
             return None
     
+    def _get_latest_stats(self, tweet_ids: List[str], columns: str = '*') -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les dernières stats de plusieurs tweets en requêtes groupées
+        
+        Interroge la vue ``latest_stats`` (une ligne par tweet, DISTINCT ON) avec
+        une requête ``.in_()`` par lot de IN_FILTER_CHUNK_SIZE tweets, au lieu
+        d'une requête ``.eq('tweet_id', ...).limit(1)`` par tweet.
+        
+        Args:
+            tweet_ids: IDs des tweets
+            columns: Colonnes stats à sélectionner
+            
+        Returns:
+            Dict tweet_id -> ligne stats la plus récente (tweets sans stats absents)
+        """
+        select_columns = columns if columns == '*' else f"tweet_id, {columns}"
+        latest: Dict[str, Dict[str, Any]] = {}
+        
+        for start in range(0, len(tweet_ids), IN_FILTER_CHUNK_SIZE):
+            chunk = tweet_ids[start:start + IN_FILTER_CHUNK_SIZE]
+            try:
+                response = self.supabase.table('latest_stats')\
+                    .select(select_columns)\
+                    .in_('tweet_id', chunk)\
+                    .execute()
+            except Exception as e:
+                # Base initialisée avant la vue: requête par tweet
+                logger.warning(f"latest_stats view unavailable (run scripts/sql/init_supabase.sql): {e}")
+                for tweet_id in chunk:
+                    stats_response = self.supabase.table('stats')\
+                        .select(select_columns)\
+                        .eq('tweet_id', tweet_id)\
+                        .order('collected_at', desc=True)\
+                        .limit(1)\
+                        .execute()
+                    if stats_response.data:
+                        latest[tweet_id] = stats_response.data[0]
+                continue
+            
+            for row in response.data or ():
+                latest[row['tweet_id']] = row
+        
+        return latest
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def get_top_performing_tweets(self, limit: int = 10, days: int = 30) -> List[Dict[str, Any]]:
         """
@@ -728,17 +842,14 @@ class StorageManager:
             
             tweets_with_stats = []
             
+            # Get latest stats for all tweets in batched requests
+            latest_stats = self._get_latest_stats(
+                [tweet['tweet_id'] for tweet in tweets_response.data]
+            )
+            
             for tweet in tweets_response.data:
-                # Get latest stats for this tweet
-                stats_response = self.supabase.table('stats')\
-                    .select('*')\
-                    .eq('tweet_id', tweet['tweet_id'])\
-                    .order('collected_at', desc=True)\
-                    .limit(1)\
-                    .execute()
-                
-                if stats_response.data:
-                    stats = stats_response.data[0]
+                stats = latest_stats.get(tweet['tweet_id'])
+                if stats:
                     # Calculate engagement score (weighted)
                     engagement_score = (
                         stats.get('likes', 0) * 1 +
@@ -749,7 +860,7 @@ class StorageManager:
                     
                     tweets_with_stats.append({
                         'tweet_id': tweet['tweet_id'],
-                        'content': tweet['content'][:100] + '...' if len(tweet['content']) > 100 else tweet['content'],
+                        'content': _preview(tweet['content']),
                         'full_content': tweet['content'],
                         'posted_at': tweet['posted_at'],
                         'image_url': tweet.get('image_url'),
@@ -811,17 +922,15 @@ class StorageManager:
             total_engagement = 0
             daily_engagement = {}
             
+            # Get latest stats for all tweets in batched requests
+            latest_stats = self._get_latest_stats(
+                [tweet['tweet_id'] for tweet in response.data],
+                columns='likes, retweets, replies, impressions'
+            )
+            
             for tweet in response.data:
-                # Get latest stats for this tweet
-                stats_response = self.supabase.table('stats')\
-                    .select('likes, retweets, replies, impressions')\
-                    .eq('tweet_id', tweet['tweet_id'])\
-                    .order('collected_at', desc=True)\
-                    .limit(1)\
-                    .execute()
-                
-                if stats_response.data:
-                    stats = stats_response.data[0]
+                stats = latest_stats.get(tweet['tweet_id'])
+                if stats:
                     engagement = (
                         stats.get('likes', 0) +
                         stats.get('retweets', 0) +
@@ -867,8 +976,9 @@ class StorageManager:
         
         sorted_days = sorted(daily_engagement.items())
         if len(sorted_days) >= 2:
-            recent_avg = sum(engagement for _, engagement in sorted_days[-3:]) / min(3, len(sorted_days))
-            older_avg = sum(engagement for _, engagement in sorted_days[:3]) / min(3, len(sorted_days))
+            window = min(3, len(sorted_days))
+            recent_avg = sum(map(itemgetter(1), sorted_days[-3:])) / window
+            older_avg = sum(map(itemgetter(1), sorted_days[:3])) / window
             
             if older_avg > 0:
                 return round(((recent_avg - older_avg) / older_avg) * 100, 1)
@@ -967,8 +1077,8 @@ class StorageManager:
             for subscription in self._subscriptions:
                 try:
                     subscription.unsubscribe()
-                except:
-                    pass
+                except Exception as e:
+                    logger.debug(f"Failed to unsubscribe realtime channel: {e}")
             
             self._subscriptions.clear()
             logger.info("✅ Storage manager closed successfully")
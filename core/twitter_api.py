@@ -24,7 +24,6 @@ import tweepy
 import requests
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
-from PIL import Image
 
 # Nouvelle architecture - Imports ajoutés par migration
 from events import get_event_bus, EventTypes, EventPriority
@@ -199,11 +198,11 @@ class TwitterAPIManager:
                 if reply_id and original_tweet_id:
                     # Check if this is a reply to our tweet
                     our_tweets = self.storage_manager.get_tweets(limit=10)
-                    our_tweet_ids = [tweet.tweet_id for tweet in our_tweets]
+                    our_tweet_ids = {tweet.tweet_id for tweet in our_tweets}
                     
                     if original_tweet_id in our_tweet_ids:
                         # Auto-like the reply
-                        success = self.like_tweet(reply_id)
+                        success = self.like_tweet(reply_id, author_id=new_reply.get('author_id'))
                         if success:
                             # Mark as liked in database
                             self.storage_manager.mark_reply_liked(reply_id)
@@ -227,9 +226,6 @@ class TwitterAPIManager:
             bool: True if within limits, False otherwise
         """
         try:
-            config = self.config_manager.get_config()
-            quotas = self.config_manager.get_current_quotas()
-            
             # Reset daily counters if needed
             now = datetime.utcnow()
             if (now - self._last_quota_reset).days >= 1:
@@ -239,14 +235,7 @@ class TwitterAPIManager:
             # Check daily limits
             current_usage = self._quota_usage.get(operation, 0)
             
-            if operation == 'posts':
-                daily_limit = quotas.posts_per_day
-            elif operation == 'reads':
-                daily_limit = quotas.reads_per_day
-            elif operation == 'likes':
-                daily_limit = config.engagement.likes_per_day
-            else:
-                daily_limit = float('inf')
+            daily_limit = self._get_daily_limits().get(operation, float('inf'))
             
             # Check if adding count would exceed limit
             if daily_limit > 0 and (current_usage + count) > daily_limit:
@@ -259,6 +248,25 @@ class TwitterAPIManager:
             logger.error(f"Error checking quota: {e}")
             return False
     
+    def _get_daily_limits(self, config=None) -> Dict[str, int]:
+        """
+        Get daily limits per operation from a single config read
+        
+        Args:
+            config: Already loaded BotConfig (optional)
+            
+        Returns:
+            Dict[str, int]: Limit per operation (0 = unlimited)
+        """
+        config = config or self.config_manager.get_config()
+        quotas = config.x_api.quotas[config.x_api.plan]
+        
+        return {
+            'posts': quotas.posts_per_day,
+            'reads': quotas.reads_per_day,
+            'likes': config.engagement.likes_per_day
+        }
+    
     def _update_quota(self, operation: str, count: int = 1) -> None:
         """Update quota usage counter"""
         self._quota_usage[operation] = self._quota_usage.get(operation, 0) + count
@@ -356,12 +364,13 @@ class TwitterAPIManager:
             return None
     
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def like_tweet(self, tweet_id: str) -> bool:
+    def like_tweet(self, tweet_id: str, author_id: Optional[str] = None) -> bool:
         """
         Like a tweet
         
         Args:
             tweet_id: ID of tweet to like
+            author_id: Author of the tweet if already known (skips the lookup)
             
         Returns:
             bool: Success status
@@ -372,37 +381,31 @@ class TwitterAPIManager:
                 logger.error("Like quota exceeded")
                 return False
             
-            # 🚨 CRITICAL FIX: Get tweet info to check if it's our own tweet
-            try:
-                tweet_response = self.client.get_tweet(tweet_id, tweet_fields=['author_id'])
-                tweet_data = tweet_response.data if hasattr(tweet_response, 'data') else tweet_response.get('data')
-                
-                if tweet_data:
-                    tweet_author_id = tweet_data.get('author_id')
-                    # Don't like our own tweets!
-                    if self.bot_user_id and tweet_author_id == self.bot_user_id:
-                        logger.debug(f"Skipping like for bot's own tweet {tweet_id}")
-                        return False
-                        
-            except Exception as e:
-                logger.warning(f"Could not check tweet author for {tweet_id}: {e}")
-                # If we can't check, better to skip
-                return False
-            
-            # Get authenticated user ID
-            me = self.client.get_me()
-            
-            # Handle different response formats
-            user_id = None
-            if hasattr(me, 'data') and me.data:
-                user_id = me.data.get('id')
-            elif isinstance(me, dict) and 'data' in me:
-                user_id = me['data'].get('id')
-                
+            # Authenticated user ID (cached at init, get_me() only if missing)
+            user_id = self._get_bot_user_id()
             if not user_id:
                 logger.error("Failed to get authenticated user ID")
                 return False
             
+            # 🚨 CRITICAL FIX: Get tweet info to check if it's our own tweet
+            if author_id is None:
+                try:
+                    tweet_response = self.client.get_tweet(tweet_id, tweet_fields=['author_id'])
+                    tweet_data = tweet_response.data if hasattr(tweet_response, 'data') else tweet_response.get('data')
+                    
+                    if tweet_data:
+                        author_id = tweet_data.get('author_id')
+                        
+                except Exception as e:
+                    logger.warning(f"Could not check tweet author for {tweet_id}: {e}")
+                    # If we can't check, better to skip
+                    return False
+            
+            # Don't like our own tweets!
+            if author_id == user_id:
+                logger.debug(f"Skipping like for bot's own tweet {tweet_id}")
+                return False
+            
             # Like the tweet
             response = self.client.like(tweet_id, user_auth=True)
             
@@ -423,6 +426,29 @@ class TwitterAPIManager:
         
         return False
     
+    def _get_bot_user_id(self) -> Optional[str]:
+        """
+        Get the authenticated bot user ID
+        
+        Uses the ID resolved during client initialization and only calls
+        get_me() when it is not known yet.
+        
+        Returns:
+            Optional[str]: Bot user ID, None if it cannot be resolved
+        """
+        if self.bot_user_id:
+            return self.bot_user_id
+        
+        me = self.client.get_me()
+        
+        # Handle different response formats
+        if hasattr(me, 'data') and me.data:
+            self.bot_user_id = me.data.get('id')
+        elif isinstance(me, dict) and 'data' in me:
+            self.bot_user_id = me['data'].get('id')
+        
+        return self.bot_user_id
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def get_tweet_replies(self, tweet_id: str, max_results: int = 10) -> List[Reply]:
         """
@@ -477,7 +503,7 @@ class TwitterAPIManager:
                             created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
                         else:
                             created_at = datetime.fromisoformat(created_at_str)
-                    except:
+                    except (TypeError, ValueError):
                         created_at = datetime.utcnow()
                     
                     reply = Reply(
@@ -636,14 +662,14 @@ class TwitterAPIManager:
     def get_quota_status(self) -> Dict[str, Any]:
         """Get current quota usage status"""
         config = self.config_manager.get_config()
-        quotas = self.config_manager.get_current_quotas()
+        limits = self._get_daily_limits(config)
         
         return {
             'daily_usage': self._quota_usage,
             'daily_limits': {
-                'posts': quotas.posts_per_day if quotas.posts_per_day > 0 else 'unlimited',
-                'reads': quotas.reads_per_day if quotas.reads_per_day > 0 else 'unlimited',
-                'likes': config.engagement.likes_per_day
+                'posts': limits['posts'] if limits['posts'] > 0 else 'unlimited',
+                'reads': limits['reads'] if limits['reads'] > 0 else 'unlimited',
+                'likes': limits['likes']
             },
             'plan': config.x_api.plan,
             'last_reset': self._last_quota_reset.isoformat()
@@ -10,6 +10,7 @@ Implémente les techniques éprouvées pour créer du contenu viral :
 """
 
 import random
+import re
 from typing import Dict, List, Tuple, Optional
 from loguru import logger
 from dataclasses import dataclass
@@ -32,6 +33,33 @@ class EngagementStrategy(Enum):
     EDUCATION = "education"         # Teach something useful
 
 
+# Indicateurs de potentiel viral par critère (construits une seule fois)
+_HOOK_INDICATORS = ("if you", "most people", "unpopular", "truth", "wrong", "stop")
+_STANCE_INDICATORS = ("there's no", "i don't care", "anyone who", "exactly why")
+_SPECIFIC_WORDS = ("exactly", "precisely", "specific", "after", "within")
+_CONTROVERSIAL_WORDS = ("controversial", "unpopular", "disagree", "wrong", "lying")
+_INTERRUPT_WORDS = ("wait", "stop", "wrong", "lying", "truth", "secret")
+
+# Règles de formatage viral, préparées une seule fois
+_HEDGING_PATTERNS: Tuple[str, ...] = tuple(
+    f" {variant} "
+    for word in ("maybe", "sometimes", "possibly", "perhaps", "might")
+    for variant in (word, word.capitalize())
+)
+_SIMPLE_REPLACEMENTS: Dict[str, str] = {
+    "utilize": "use",
+    "facilitate": "help",
+    "approximately": "about",
+    "numerous": "many",
+    "additionally": "also"
+}
+_SIMPLE_REPLACEMENTS.update({
+    complex_word.capitalize(): simple_word.capitalize()
+    for complex_word, simple_word in list(_SIMPLE_REPLACEMENTS.items())
+})
+_SIMPLE_REPLACEMENTS_PATTERN = re.compile("|".join(map(re.escape, _SIMPLE_REPLACEMENTS)))
+
+
 @dataclass
 class ViralStructure:
     """Structure d'un tweet viral selon Nick Huber"""
@@ -287,25 +315,11 @@ class ViralStrategies:
     def _apply_formatting_rules(self, text: str) -> str:
         """Applique les règles de formatage viral"""
         # Supprimer les mots d'hésitation
-        hedging_words = ["maybe", "sometimes", "possibly", "perhaps", "might"]
-        for word in hedging_words:
-            text = text.replace(f" {word} ", " ")
-            text = text.replace(f" {word.capitalize()} ", " ")
-        
-        # Simplifier le langage
-        replacements = {
-            "utilize": "use",
-            "facilitate": "help", 
-            "approximately": "about",
-            "numerous": "many",
-            "additionally": "also"
-        }
-        
-        for complex_word, simple_word in replacements.items():
-            text = text.replace(complex_word, simple_word)
-            text = text.replace(complex_word.capitalize(), simple_word.capitalize())
+        for pattern in _HEDGING_PATTERNS:
+            text = text.replace(pattern, " ")
         
-        return text
+        # Simplifier le langage (une seule passe)
+        return _SIMPLE_REPLACEMENTS_PATTERN.sub(lambda match: _SIMPLE_REPLACEMENTS[match.group(0)], text)
     
     def get_viral_topic_suggestions(self, category: str = "crypto") -> List[str]:
         """Retourne des suggestions de sujets viraux"""
@@ -329,33 +343,29 @@ class ViralStrategies:
             "overall": 0.0             # Score global
         }
         
+        text_lower = text.lower()
+        
         # Analyser le hook (première ligne)
-        first_line = text.split('\n')[0] if '\n' in text else text
-        hook_indicators = ["if you", "most people", "unpopular", "truth", "wrong", "stop"]
-        scores["hook_strength"] = sum(1 for indicator in hook_indicators 
-                                    if indicator in first_line.lower()) / len(hook_indicators)
+        first_line = text_lower.split('\n', 1)[0]
+        scores["hook_strength"] = sum(1 for indicator in _HOOK_INDICATORS
+                                    if indicator in first_line) / len(_HOOK_INDICATORS)
         
         # Analyser la clarté de position
-        stance_indicators = ["there's no", "i don't care", "anyone who", "exactly why"]
-        scores["stance_clarity"] = sum(1 for indicator in stance_indicators 
-                                     if indicator in text.lower()) / len(stance_indicators)
+        scores["stance_clarity"] = sum(1 for indicator in _STANCE_INDICATORS
+                                     if indicator in text_lower) / len(_STANCE_INDICATORS)
         
         # Analyser la spécificité
-        import re
         numbers = re.findall(r'\d+', text)
-        specific_words = ["exactly", "precisely", "specific", "after", "within"]
-        scores["specificity"] = (len(numbers) + sum(1 for word in specific_words 
-                               if word in text.lower())) / 10
+        scores["specificity"] = (len(numbers) + sum(1 for word in _SPECIFIC_WORDS
+                               if word in text_lower)) / 10
         
         # Analyser le potentiel de controverse
-        controversial_words = ["controversial", "unpopular", "disagree", "wrong", "lying"]
-        scores["controversy"] = sum(1 for word in controversial_words 
-                                  if word in text.lower()) / len(controversial_words)
+        scores["controversy"] = sum(1 for word in _CONTROVERSIAL_WORDS
+                                  if word in text_lower) / len(_CONTROVERSIAL_WORDS)
         
         # Pattern interrupt (mots qui arrêtent le scroll)
-        interrupt_words = ["wait", "stop", "wrong", "lying", "truth", "secret"]
-        scores["pattern_interrupt"] = sum(1 for word in interrupt_words 
-                                        if word in text.lower()) / len(interrupt_words)
+        scores["pattern_interrupt"] = sum(1 for word in _INTERRUPT_WORDS
+                                        if word in text_lower) / len(_INTERRUPT_WORDS)
         
         # Score global
         scores["overall"] = sum(scores.values()) / (len(scores) - 1)
@@ -10,12 +10,18 @@ import subprocess
 from pathlib import Path
 
 
+# Séparateurs d'affichage (construits une seule fois)
+SEPARATOR = "=" * 60
+SECTION_SEPARATOR = "=" * 30
+SUMMARY_SEPARATOR = "=" * 35
+
+
 def print_header():
     """Affiche l'en-tête du script"""
     print("🤖 Twitter Bot Automatisé - Installation & Vérification")
-    print("=" * 60)
+    print(SEPARATOR)
     print("Version 2.0 - Structure Réorganisée")
-    print("=" * 60)
+    print(SEPARATOR)
 
 
 def check_python_version():
@@ -49,17 +55,12 @@ def check_structure():
         "config/requirements.txt"
     ]
     
-    missing = []
-    
-    # Vérifier les dossiers
-    for dir_name in required_dirs:
-        if not Path(dir_name).exists():
-            missing.append(f"📂 {dir_name}/")
-    
-    # Vérifier les fichiers
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing.append(f"📄 {file_path}")
+    # Vérifier dossiers et fichiers en une seule passe
+    missing = [
+        f"📂 {path}/" if path in required_dirs else f"📄 {path}"
+        for path in required_dirs + required_files
+        if not os.path.exists(path)
+    ]
     
     if missing:
         print("❌ Fichiers/dossiers manquants:")
@@ -190,7 +191,7 @@ def run_quick_test():
 def print_next_steps():
     """Affiche les prochaines étapes"""
     print("\n🎯 Prochaines Étapes")
-    print("=" * 30)
+    print(SECTION_SEPARATOR)
     print("1. Configurez vos clés API dans .env")
     print("2. Ajustez config/config.json selon vos besoins")
     print("3. Personnalisez config/prompts.json (optionnel)")
@@ -226,7 +227,7 @@ def main():
     
     # Résumé
     print("\n📋 Résumé de l'Installation")
-    print("=" * 35)
+    print(SUMMARY_SEPARATOR)
     
     success_count = 0
     for name, success in results:
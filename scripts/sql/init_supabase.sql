@@ -85,6 +85,7 @@ CREATE INDEX IF NOT EXISTS idx_replies_reply_id ON replies(reply_id);
 -- Stats indexes
 CREATE INDEX IF NOT EXISTS idx_stats_tweet_id ON stats(tweet_id);
 CREATE INDEX IF NOT EXISTS idx_stats_collected_at ON stats(collected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_stats_tweet_id_collected_at ON stats(tweet_id, collected_at DESC);
 
 -- Configs indexes
 CREATE INDEX IF NOT EXISTS idx_configs_key ON configs(key);
@@ -223,6 +224,12 @@ WHERE posted_at >= CURRENT_DATE - INTERVAL '7 days'
 ORDER BY (engagement->>'likes')::int DESC
 LIMIT 10;
 
+-- Latest stats snapshot per tweet
+CREATE OR REPLACE VIEW latest_stats AS
+SELECT DISTINCT ON (tweet_id) *
+FROM stats
+ORDER BY tweet_id, collected_at DESC;
+
 -- Engagement rate view
 CREATE OR REPLACE VIEW engagement_overview AS
 SELECT 
@@ -287,6 +294,17 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Vérifie à l'exécution que replies.reply_id reste indexé (appelé au démarrage du bot)
+CREATE OR REPLACE FUNCTION has_reply_id_index()
+RETURNS BOOLEAN AS $$
+    SELECT EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE schemaname = 'public'
+          AND tablename = 'replies'
+          AND indexdef ILIKE '%(reply_id)%'
+    );
+$$ LANGUAGE sql STABLE;
+
 -- =====================================================
 -- Completion Message
 -- =====================================================
@@ -297,6 +315,6 @@ BEGIN
     RAISE NOTICE 'Tables created: tweets, replies, stats, configs, quota_tracking';
     RAISE NOTICE 'Storage bucket created: generated-images';
     RAISE NOTICE 'Realtime enabled for: replies';
-    RAISE NOTICE 'Views created: daily_stats, top_tweets, engagement_overview';
-    RAISE NOTICE 'Functions created: update_quota_usage, get_quota_status';
+    RAISE NOTICE 'Views created: daily_stats, top_tweets, latest_stats, engagement_overview';
+    RAISE NOTICE 'Functions created: update_quota_usage, get_quota_status, has_reply_id_index';
 END $$; 
\ No newline at end of file
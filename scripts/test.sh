@@ -13,20 +13,21 @@ NC='\033[0m' # No Color
 
 # Test configuration
 TEST_DIR="tests"
+PYTEST_CONFIG="config/pytest.ini"
 COVERAGE_THRESHOLD=80
 
 # Check if pytest is available
 check_pytest() {
     if ! command -v pytest &> /dev/null; then
         echo -e "${RED}❌ pytest not found. Installing...${NC}"
-        pip install pytest pytest-cov pytest-asyncio
+        pip install pytest pytest-cov pytest-asyncio pytest-xdist
     fi
 }
 
 # Run unit tests
 run_unit_tests() {
     echo -e "${BLUE}Running unit tests...${NC}"
-    pytest $TEST_DIR -m "not integration and not slow" -v
+    pytest -c $PYTEST_CONFIG --rootdir . $TEST_DIR -m "not integration and not slow" -v
     
     if [[ $? -eq 0 ]]; then
         echo -e "${GREEN}✅ Unit tests passed${NC}"
@@ -39,7 +40,7 @@ run_unit_tests() {
 # Run integration tests
 run_integration_tests() {
     echo -e "${BLUE}Running integration tests...${NC}"
-    pytest $TEST_DIR -m "integration" -v --timeout=60
+    pytest -c $PYTEST_CONFIG --rootdir . $TEST_DIR -m "integration" -v --timeout=60
     
     if [[ $? -eq 0 ]]; then
         echo -e "${GREEN}✅ Integration tests passed${NC}"
@@ -52,7 +53,7 @@ run_integration_tests() {
 # Run slow tests
 run_slow_tests() {
     echo -e "${BLUE}Running slow tests...${NC}"
-    pytest $TEST_DIR -m "slow" -v --timeout=120
+    pytest -c $PYTEST_CONFIG --rootdir . $TEST_DIR -m "slow" -v --timeout=120
     
     if [[ $? -eq 0 ]]; then
         echo -e "${GREEN}✅ Slow tests passed${NC}"
@@ -65,7 +66,7 @@ run_slow_tests() {
 # Run all tests with coverage
 run_all_tests() {
     echo -e "${BLUE}Running all tests with coverage...${NC}"
-    pytest $TEST_DIR -v \
+    pytest -c $PYTEST_CONFIG --rootdir . $TEST_DIR -v \
         --cov=. \
         --cov-report=term-missing \
         --cov-report=html:htmlcov \
@@ -85,7 +86,7 @@ run_all_tests() {
 run_specific_test() {
     local test_target="$1"
     echo -e "${BLUE}Running specific test: $test_target${NC}"
-    pytest "$test_target" -v
+    pytest -c $PYTEST_CONFIG --rootdir . "$test_target" -v
     
     if [[ $? -eq 0 ]]; then
         echo -e "${GREEN}✅ Test passed${NC}"
@@ -148,7 +149,7 @@ generate_test_report() {
     mkdir -p reports
     
     # Run tests with JUnit XML output
-    pytest $TEST_DIR \
+    pytest -c $PYTEST_CONFIG --rootdir . $TEST_DIR \
         --junitxml=reports/test-results.xml \
         --cov=. \
         --cov-report=xml:reports/coverage.xml \
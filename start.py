@@ -18,15 +18,19 @@ import threading
 import subprocess
 from pathlib import Path
 
+# Séparateurs d'affichage (construits une seule fois)
+SEPARATOR = "=" * 60
+SUB_SEPARATOR = "-" * 40
+
 def print_banner():
     """Affiche la bannière de démarrage"""
-    print("=" * 60)
+    print(SEPARATOR)
     print("🤖 BOT TWITTER AUTOMATISÉ - LANCEUR UNIFIÉ")
-    print("=" * 60)
+    print(SEPARATOR)
     print("✨ Configuration simplifiée - Un seul fichier pour tout !")
     print("🌐 Dashboard: http://localhost:8080")
     print("🤖 Bot: Génération automatique + engagement")
-    print("=" * 60)
+    print(SEPARATOR)
 
 def setup_environment():
     """Configure l'environnement Python"""
@@ -43,7 +47,7 @@ def start_dashboard_only():
     try:
         print("📊 DÉMARRAGE DASHBOARD SEULEMENT")
         print("🌐 Interface web: http://localhost:8080")
-        print("-" * 40)
+        print(SUB_SEPARATOR)
         
         setup_environment()
         
@@ -63,7 +67,7 @@ def start_bot_only():
     try:
         print("🤖 DÉMARRAGE BOT SEULEMENT")
         print("📝 Logs dans logs/bot_*.log")
-        print("-" * 40)
+        print(SUB_SEPARATOR)
         
         setup_environment()
         
@@ -93,7 +97,7 @@ def start_bot_and_dashboard():
         print("🚀 DÉMARRAGE COMPLET - BOT + DASHBOARD")
         print("🌐 Dashboard: http://localhost:8080")
         print("🤖 Bot: Automatisation complète")
-        print("-" * 40)
+        print(SUB_SEPARATOR)
         
         setup_environment()
         
@@ -112,7 +116,7 @@ def start_bot_and_dashboard():
         
         print("✅ Dashboard en cours de démarrage")
         print("🤖 Lancement du bot principal...")
-        print("-" * 40)
+        print(SUB_SEPARATOR)
         
         # Lancer le bot principal
         from main import main as bot_main
@@ -0,0 +1,24 @@
+"""
+Configuration pytest partagée
+"""
+
+import pytest
+
+# Markers dont les tests partagent un worker xdist (--dist=loadgroup)
+XDIST_GROUP_MARKERS = ("twitter", "llm")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Regroupe les tests marqués twitter/llm sur leur propre worker xdist
+    
+    Exécuté avant le hook de xdist, qui lit xdist_group pendant la collecte.
+    """
+    for item in items:
+        if item.get_closest_marker("xdist_group"):
+            continue
+        for name in XDIST_GROUP_MARKERS:
+            if item.get_closest_marker(name):
+                item.add_marker(pytest.mark.xdist_group(name=name))
+                break
@@ -9,9 +9,17 @@ Utilitaire simple pour générer des tweets viraux optimisés
 import sys
 from pathlib import Path
 
-# Ajouter le répertoire racine au path
-sys.path.insert(0, str(Path(__file__).parent))
-sys.path.insert(0, str(Path(__file__).parent / "core"))
+# Ajouter le répertoire racine et core au path (une seule fois)
+root_dir = Path(__file__).resolve().parent.parent
+for path in (str(root_dir), str(root_dir / "core")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Séparateurs d'affichage (construits une seule fois)
+SEPARATOR = "=" * 60
+TWEET_SEPARATOR = "=" * 50
+SUB_SEPARATOR = "-" * 40
+ITEM_SEPARATOR = "-" * 30
 
 def generate_viral_tweet(topic=None, content_type=None, strategy=None):
     """Génère un tweet viral avec analyse"""
@@ -39,35 +47,40 @@ def generate_viral_tweet(topic=None, content_type=None, strategy=None):
         )
         
         if viral_tweet:
-            print("✅ TWEET VIRAL GÉNÉRÉ!")
-            print("=" * 50)
-            print(viral_tweet)
-            print("=" * 50)
-            print(f"📏 Longueur: {len(viral_tweet)} caractères")
+            # Construire la sortie en mémoire puis l'écrire en une fois
+            out = [
+                "✅ TWEET VIRAL GÉNÉRÉ!",
+                TWEET_SEPARATOR,
+                viral_tweet,
+                TWEET_SEPARATOR,
+                f"📏 Longueur: {len(viral_tweet)} caractères",
+                "\n📊 ANALYSE DU POTENTIEL VIRAL:",
+            ]
             
             # Analyser le potentiel viral
-            print("\n📊 ANALYSE DU POTENTIEL VIRAL:")
             analysis = content_generator.get_viral_analysis(viral_tweet)
             
             if "error" not in analysis:
                 scores = analysis.get('scores', {})
-                print(f"   📈 Score global: {scores.get('overall', 0):.2f}/1.0")
-                print(f"   🎯 Grade: {analysis.get('grade', 'N/A')}")
-                print(f"   💪 Hook strength: {scores.get('hook_strength', 0):.2f}")
-                print(f"   🔥 Stance clarity: {scores.get('stance_clarity', 0):.2f}")
-                print(f"   📋 Specificity: {scores.get('specificity', 0):.2f}")
-                print(f"   ⚡ Controversy: {scores.get('controversy', 0):.2f}")
-                print(f"   🛑 Pattern interrupt: {scores.get('pattern_interrupt', 0):.2f}")
-                
-                print(f"\n💭 {analysis.get('overall_assessment', '')}")
+                out += [
+                    f"   📈 Score global: {scores.get('overall', 0):.2f}/1.0",
+                    f"   🎯 Grade: {analysis.get('grade', 'N/A')}",
+                    f"   💪 Hook strength: {scores.get('hook_strength', 0):.2f}",
+                    f"   🔥 Stance clarity: {scores.get('stance_clarity', 0):.2f}",
+                    f"   📋 Specificity: {scores.get('specificity', 0):.2f}",
+                    f"   ⚡ Controversy: {scores.get('controversy', 0):.2f}",
+                    f"   🛑 Pattern interrupt: {scores.get('pattern_interrupt', 0):.2f}",
+                    f"\n💭 {analysis.get('overall_assessment', '')}",
+                ]
                 
                 if analysis.get('recommendations'):
-                    print(f"\n💡 RECOMMANDATIONS D'AMÉLIORATION:")
-                    for i, rec in enumerate(analysis['recommendations'], 1):
-                        print(f"   {i}. {rec}")
+                    out.append(f"\n💡 RECOMMANDATIONS D'AMÉLIORATION:")
+                    out += [f"   {i}. {rec}" for i, rec in enumerate(analysis['recommendations'], 1)]
                         
             else:
-                print(f"   ❌ Erreur d'analyse: {analysis['error']}")
+                out.append(f"   ❌ Erreur d'analyse: {analysis['error']}")
+            
+            sys.stdout.write("\n".join(out) + "\n")
                 
             return viral_tweet
         else:
@@ -92,6 +105,7 @@ Exemples d'utilisation:
   python generate_viral_tweet.py --topic "Bitcoin vs Ethereum"
   python generate_viral_tweet.py --type controversial_stance --strategy provocation
   python generate_viral_tweet.py --topic "DeFi regulation" --type educational_value --strategy education
+  python generate_viral_tweet.py --multiple 5 --yes
   
 Types de contenu disponibles:
   - powerful_hook         : Hook puissant pour capturer l'attention
@@ -136,10 +150,16 @@ Stratégies d'engagement:
         help='Analyser un tweet existant au lieu d\'en générer un nouveau'
     )
     
+    parser.add_argument(
+        '--yes', '-y',
+        action='store_true',
+        help='Enchaîner les tweets sans pause interactive (avec --multiple)'
+    )
+    
     args = parser.parse_args()
     
     print("🤖 Générateur de Tweets Viraux - Stratégies Nick Huber")
-    print("=" * 60)
+    print(SEPARATOR)
     
     if args.analyze_only:
         # Mode analyse seulement
@@ -149,20 +169,23 @@ Stratégies d'engagement:
             content_generator = container.get('content')
             
             print(f"📊 Analyse du tweet: {args.analyze_only}")
-            print("-" * 40)
+            print(SUB_SEPARATOR)
             
             analysis = content_generator.get_viral_analysis(args.analyze_only)
             
             if "error" not in analysis:
                 scores = analysis.get('scores', {})
-                print(f"📈 Score global: {scores.get('overall', 0):.2f}/1.0")
-                print(f"🎯 Grade: {analysis.get('grade', 'N/A')}")
-                print(f"💭 {analysis.get('overall_assessment', '')}")
+                out = [
+                    f"📈 Score global: {scores.get('overall', 0):.2f}/1.0",
+                    f"🎯 Grade: {analysis.get('grade', 'N/A')}",
+                    f"💭 {analysis.get('overall_assessment', '')}",
+                ]
                 
                 if analysis.get('recommendations'):
-                    print(f"\n💡 Recommandations:")
-                    for i, rec in enumerate(analysis['recommendations'], 1):
-                        print(f"   {i}. {rec}")
+                    out.append(f"\n💡 Recommandations:")
+                    out += [f"   {i}. {rec}" for i, rec in enumerate(analysis['recommendations'], 1)]
+                
+                sys.stdout.write("\n".join(out) + "\n")
             else:
                 print(f"❌ Erreur: {analysis['error']}")
                 
@@ -172,10 +195,13 @@ Stratégies d'engagement:
         return
     
     # Mode génération
+    # Pause entre les tweets seulement en session interactive
+    pause_between = not args.yes and sys.stdin.isatty()
+    
     for i in range(args.multiple):
         if args.multiple > 1:
             print(f"\n🔄 Tweet #{i+1}/{args.multiple}")
-            print("-" * 30)
+            print(ITEM_SEPARATOR)
             
         tweet = generate_viral_tweet(
             topic=args.topic,
@@ -183,7 +209,7 @@ Stratégies d'engagement:
             strategy=args.strategy
         )
         
-        if tweet and args.multiple > 1 and i < args.multiple - 1:
+        if pause_between and tweet and i < args.multiple - 1:
             input("\n⏸️  Appuyez sur Entrée pour le tweet suivant...")
 
 if __name__ == "__main__":